@@ -6,16 +6,18 @@ from typing import List, Optional
 import click
 
 from . import __version__
-from .formatters import format_csv, format_html, format_json, format_markdown
-from .github import check_github_auth, get_github_repos
-from .gitlab import check_gitlab_auth, get_gitlab_groups
 from .utils import (
+    DEFAULT_CACHE_TTL,
     check_cli_available,
     console,
     ensure_output_directory,
     load_config,
 )
 
+# --platform choices that include each platform
+GITLAB_PLATFORMS = frozenset({'all', 'gitlab'})
+GITHUB_PLATFORMS = frozenset({'all', 'github'})
+
 
 @click.group()
 @click.version_option(version=__version__)
@@ -54,7 +56,7 @@ def main():
 @click.option(
     '--include-languages/--no-languages',
     default=False,
-    help='Include detailed language breakdown (slower for GitLab)'
+    help='Include detailed language breakdown (slower)'
 )
 @click.option(
     '--gitlab-groups',
@@ -71,6 +73,35 @@ def main():
     multiple=True,
     help='GitHub owners/orgs to fetch (overrides config)'
 )
+@click.option(
+    '--pretty/--no-pretty',
+    default=False,
+    help='Run mdformat over generated Markdown reports'
+)
+@click.option(
+    '--compact',
+    is_flag=True,
+    default=False,
+    help='Write JSON reports without indentation'
+)
+@click.option(
+    '--cache/--no-cache',
+    default=True,
+    help='Reuse recently fetched GitHub data and GitLab language/size lookups from the local cache'
+)
+@click.option(
+    '--cache-ttl',
+    type=click.IntRange(min=0),
+    default=DEFAULT_CACHE_TTL,
+    show_default=True,
+    help='Maximum age of cached data in seconds'
+)
+@click.option(
+    '--legacy-fetch',
+    is_flag=True,
+    default=False,
+    help='Fetch GitHub repos with one gh repo list call per owner instead of batched GraphQL queries'
+)
 def generate(
     platform: str,
     formats: tuple,
@@ -80,6 +111,11 @@ def generate(
     gitlab_groups: tuple,
     gitlab_mine: bool,
     github_owners: tuple,
+    pretty: bool,
+    compact: bool,
+    cache: bool,
+    cache_ttl: int,
+    legacy_fetch: bool,
 ):
     """Generate repository summary reports."""
     console.print(f"[bold]Repository Summary Generator v{__version__}[/bold]\n")
@@ -89,20 +125,22 @@ def generate(
         return
 
     # Load configuration
-    cfg = load_config(config) if config.exists() else {}
+    cfg = (load_config(config) if config.exists() else None) or {}
+    gitlab_cfg = cfg.get('gitlab') or {}
+    github_cfg = cfg.get('github') or {}
 
     # Get GitLab groups
-    gitlab_groups_list = list(gitlab_groups) if gitlab_groups else cfg.get('gitlab', {}).get('groups', [])
+    gitlab_groups_list = list(gitlab_groups) if gitlab_groups else gitlab_cfg.get('groups', [])
 
     # Check if we should include personal GitLab repos
-    gitlab_include_mine = gitlab_mine or cfg.get('gitlab', {}).get('include_mine', False)
+    gitlab_include_mine = gitlab_mine or gitlab_cfg.get('include_mine', False)
 
     # Get GitHub owners
-    github_owners_list = list(github_owners) if github_owners else cfg.get('github', {}).get('owners', [])
+    github_owners_list = list(github_owners) if github_owners else github_cfg.get('owners', [])
 
     # Validate platform availability and configuration
-    should_fetch_gitlab = platform in ['all', 'gitlab'] and (gitlab_groups_list or gitlab_include_mine)
-    should_fetch_github = platform in ['all', 'github'] and github_owners_list
+    should_fetch_gitlab = platform in GITLAB_PLATFORMS and (gitlab_groups_list or gitlab_include_mine)
+    should_fetch_github = platform in GITHUB_PLATFORMS and github_owners_list
 
     if not should_fetch_gitlab and not should_fetch_github:
         console.print("[red]Error: No platforms configured. Please provide groups/owners via CLI or config file.[/red]")
@@ -110,6 +148,8 @@ def generate(
 
     # Check CLI tools availability
     if should_fetch_gitlab:
+        from .gitlab import check_gitlab_auth
+
         if not check_cli_available('glab'):
             console.print("[red]Error: glab CLI not found. Please install it: https://gitlab.com/gitlab-org/cli[/red]")
             return
@@ -118,6 +158,8 @@ def generate(
             return
 
     if should_fetch_github:
+        from .github import check_github_auth
+
         if not check_cli_available('gh'):
             console.print("[red]Error: gh CLI not found. Please install it: https://cli.github.com/[/red]")
             return
@@ -129,16 +171,31 @@ def generate(
     all_data = {}
 
     if should_fetch_gitlab:
+        from .gitlab import get_gitlab_groups
+
         console.print("[bold blue]Fetching GitLab repositories...[/bold blue]")
-        gitlab_data = get_gitlab_groups(gitlab_groups_list, include_languages, gitlab_include_mine)
+        gitlab_data = get_gitlab_groups(
+            gitlab_groups_list,
+            include_languages,
+            gitlab_include_mine,
+            cache_ttl=cache_ttl if cache else None,
+        )
         if gitlab_data:
             all_data['gitlab'] = gitlab_data
         console.print()
 
     if should_fetch_github:
+        from .github import get_github_repos
+
         console.print("[bold blue]Fetching GitHub repositories...[/bold blue]")
-        github_limit = cfg.get('github', {}).get('limit', 100)
-        github_data = get_github_repos(github_owners_list, limit=github_limit)
+        github_limit = github_cfg.get('limit', 100)
+        github_data = get_github_repos(
+            github_owners_list,
+            limit=github_limit,
+            cache_ttl=cache_ttl if cache else None,
+            legacy_fetch=legacy_fetch,
+            include_languages=include_languages,
+        )
         if github_data:
             all_data['github'] = github_data
         console.print()
@@ -147,6 +204,9 @@ def generate(
         console.print("[yellow]No repository data collected.[/yellow]")
         return
 
+    # Sort organizations once here rather than in every formatter
+    all_data = {platform: dict(sorted(orgs.items())) for platform, orgs in all_data.items()}
+
     # Generate output files
     console.print("[bold blue]Generating reports...[/bold blue]")
 
@@ -159,19 +219,34 @@ def generate(
     else:
         prefix = "All-Platforms"
 
+    # Markdown and HTML share the same display columns, so collect them once
+    tables = None
+    if 'markdown' in formats_list or 'html' in formats_list:
+        from .formatters import normalize_for_output
+
+        tables = normalize_for_output(all_data)
+
     for fmt in formats_list:
         if fmt == 'markdown':
+            from .formatters import format_markdown
+
             output_file = output / f'{prefix}-Repository-Summary.md'
-            format_markdown(all_data, output_file)
+            format_markdown(all_data, output_file, pretty=pretty, tables=tables)
         elif fmt == 'json':
+            from .formatters import format_json
+
             output_file = output / f'{prefix.lower()}-repository-summary.json'
-            format_json(all_data, output_file)
+            format_json(all_data, output_file, compact=compact)
         elif fmt == 'csv':
+            from .formatters import format_csv
+
             output_file = output / f'{prefix.lower()}-repository-summary.csv'
             format_csv(all_data, output_file)
         elif fmt == 'html':
+            from .formatters import format_html
+
             output_file = output / f'{prefix.lower()}-repository-summary.html'
-            format_html(all_data, output_file)
+            format_html(all_data, output_file, tables=tables)
 
     console.print(f"\n[bold green]✓ Reports generated successfully![/bold green]")
 
@@ -181,8 +256,14 @@ def check():
     """Check CLI tools and authentication status."""
     console.print("[bold]Checking CLI tools and authentication...[/bold]\n")
 
+    # Report current status rather than anything cached earlier in the process
+    check_cli_available.cache_clear()
+
     # Check glab
     if check_cli_available('glab'):
+        from .gitlab import check_gitlab_auth
+
+        check_gitlab_auth.cache_clear()
         console.print("[green]✓[/green] glab CLI is installed")
         if check_gitlab_auth():
             console.print("[green]✓[/green] GitLab authentication is valid")
@@ -195,6 +276,9 @@ def check():
 
     # Check gh
     if check_cli_available('gh'):
+        from .github import check_github_auth
+
+        check_github_auth.cache_clear()
         console.print("[green]✓[/green] gh CLI is installed")
         if check_github_auth():
             console.print("[green]✓[/green] GitHub authentication is valid")
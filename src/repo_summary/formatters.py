@@ -1,56 +1,139 @@
 """Output formatters for repository data."""
 
 import csv
+import functools
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-
-from jinja2 import Template
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .utils import RepoInfo, console, truncate_description
+
+# Optional accelerator from the "fast" extra, resolved once at import
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for report files, so large reports need few write syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Result of the mdformat availability probe, once it has run
+_MDFORMAT_AVAILABLE: Optional[bool] = None
+
+# Characters that would break a Markdown table cell; line breaks are already
+# flattened out of desc_short at extraction time
+_MD_ESCAPE = str.maketrans({"|": "\\|"})
+
+# CSV columns following platform and organization, mapped to the repository
+# key each one is read from
+CSV_FIELDS = {
+    "name": "name",
+    "path": "path",
+    "description": "description",
+    "url": "url",
+    "primary_language": "primary_language",
+    "stars": "stars",
+    "forks": "forks",
+    "open_issues": "open_issues",
+    "size": "size",
+    "size_bytes": "size_bytes",
+    "visibility": "visibility",
+    "archived": "archived",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "default_branch": "default_branch",
+    "license": "license",
+    "topics": "topics_str",
+}
+
+
+@dataclass
+class NormalizedRepos:
+    """Display columns for one organization's repositories, as parallel lists.
+
+    Built once by ``normalize_for_output`` and shared by the Markdown and HTML
+    formatters, so each repository's fields are looked up only once however
+    many formats are written.
+    """
 
-from .utils import console
+    paths: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    descs: List[str] = field(default_factory=list)
+    updated_ats: List[str] = field(default_factory=list)
+    archived: List[bool] = field(default_factory=list)
+    archived_flags: List[str] = field(default_factory=list)
+    private: List[bool] = field(default_factory=list)
+    languages: List[str] = field(default_factory=list)
+    sizes: List[str] = field(default_factory=list)
+
+    def rows(self) -> Iterator[Tuple]:
+        """Iterate over (path, url, desc, updated_at, archived, private, language, size) rows."""
+        return zip(
+            self.paths,
+            self.urls,
+            self.descs,
+            self.updated_ats,
+            self.archived,
+            self.private,
+            self.languages,
+            self.sizes,
+        )
 
 
-def truncate_description(text: str, max_length: int = 100, suffix: str = "...") -> str:
-    """Truncate text at word boundary with ellipsis.
+def normalize_for_output(
+    data: Dict[str, Dict[str, List[RepoInfo]]]
+) -> Dict[str, Dict[str, NormalizedRepos]]:
+    """Collect the display columns of every organization into a NormalizedRepos.
 
     Args:
-        text: Text to truncate
-        max_length: Maximum length before truncation (default: 100)
-        suffix: Suffix to add when truncating (default: "...")
+        data: Repository data grouped by platform and organization, in display order
 
     Returns:
-        Truncated text with suffix, or original text if within limit
+        Dictionary mapping platform and organization names to their NormalizedRepos
     """
-    if len(text) <= max_length:
-        return text
-
-    # Truncate to max_length
-    truncated = text[:max_length]
-
-    # Find the last space before the truncation point
-    last_space = truncated.rfind(" ")
-
-    # Only use word boundary if it's reasonably close (at least 70% of max_length)
-    if last_space > max_length * 0.7:
-        return truncated[:last_space] + suffix
-    else:
-        # No good word boundary found, just truncate and add suffix
-        return truncated + suffix
-
-
-def format_markdown(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -> bool:
+    tables = {}
+    for platform, orgs in data.items():
+        tables[platform] = {}
+        for org, repos in orgs.items():
+            table = NormalizedRepos()
+            for repo in repos:
+                table.paths.append(repo.path)
+                table.urls.append(repo.url)
+                table.descs.append(repo.desc_short)
+                table.updated_ats.append(repo.updated_at)
+                table.archived.append(repo.archived)
+                table.archived_flags.append(repo.archived_flag)
+                table.private.append(repo.visibility == "private")
+                table.languages.append(repo.primary_language or "")
+                table.sizes.append(repo.size)
+            tables[platform][org] = table
+    return tables
+
+
+def format_markdown(
+    data: Dict[str, Dict[str, List[RepoInfo]]],
+    output_file: Path,
+    pretty: bool = False,
+    tables: Optional[Dict[str, Dict[str, NormalizedRepos]]] = None,
+) -> bool:
     """Format repository data as Markdown tables.
 
     Args:
-        data: Repository data grouped by platform and organization
+        data: Repository data grouped by platform and organization, in display order
         output_file: Path to output file
+        pretty: Whether to run mdformat over the written file
+        tables: Output of ``normalize_for_output(data)``, if already computed
 
     Returns:
         True if formatting succeeded, False otherwise
     """
+    if tables is None:
+        tables = normalize_for_output(data)
+
     try:
-        with open(output_file, "w") as f:
+        with open(output_file, "w", buffering=WRITE_BUFFER_SIZE) as f:
             # Write header
             f.write("# Repository Summary\n\n")
             f.write(
@@ -58,27 +141,28 @@ def format_markdown(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -
             )
 
             # Write GitLab repos
-            if "gitlab" in data:
+            if "gitlab" in tables:
                 f.write("## GitLab Repositories\n\n")
-                for group, repos in sorted(data["gitlab"].items()):
+                for group, table in tables["gitlab"].items():
                     f.write(f"### {group}\n\n")
                     f.write(f"`glab repo list --group {group}`\n\n")
-                    write_markdown_table(f, repos)
+                    write_markdown_table(f, table)
                     f.write("\n")
 
             # Write GitHub repos
-            if "github" in data:
+            if "github" in tables:
                 f.write("## GitHub Repositories\n\n")
-                for owner, repos in sorted(data["github"].items()):
+                for owner, table in tables["github"].items():
                     f.write(f"### {owner}\n\n")
                     f.write(f"`gh repo list {owner}`\n\n")
-                    write_markdown_table(f, repos)
+                    write_markdown_table(f, table)
                     f.write("\n")
 
         console.print(f"[green]✓[/green] Markdown report saved to {output_file}")
 
-        # Format the markdown file using mdformat if available
-        format_markdown_file(output_file)
+        # Format the markdown file using mdformat if requested and available
+        if pretty:
+            format_markdown_file(output_file)
 
         return True
 
@@ -87,6 +171,28 @@ def format_markdown(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -
         return False
 
 
+def mdformat_available() -> bool:
+    """Check whether mdformat can be run, probing only once per process.
+
+    Returns:
+        True if mdformat is available, False otherwise
+    """
+    global _MDFORMAT_AVAILABLE
+
+    if _MDFORMAT_AVAILABLE is None:
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["uv", "run", "mdformat", "--version"], capture_output=True, text=True, timeout=5
+            )
+            _MDFORMAT_AVAILABLE = result.returncode == 0
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            _MDFORMAT_AVAILABLE = False
+
+    return _MDFORMAT_AVAILABLE
+
+
 def format_markdown_file(file_path: Path) -> bool:
     """Format a Markdown file using mdformat if available.
 
@@ -98,16 +204,11 @@ def format_markdown_file(file_path: Path) -> bool:
     """
     import subprocess
 
-    try:
-        # Check if mdformat is available
-        result = subprocess.run(
-            ["uv", "run", "mdformat", "--version"], capture_output=True, text=True, timeout=5
-        )
-
-        if result.returncode != 0:
-            # mdformat not available, skip formatting
-            return False
+    if not mdformat_available():
+        # mdformat not available, skip formatting
+        return False
 
+    try:
         # Format the file
         subprocess.run(
             ["uv", "run", "mdformat", str(file_path)],
@@ -129,46 +230,60 @@ def format_markdown_file(file_path: Path) -> bool:
         return False
 
 
-def write_markdown_table(f, repos: List[Dict]):
+def write_markdown_table(f, table: NormalizedRepos):
     """Write a Markdown table for repositories.
 
     Args:
         f: File handle
-        repos: List of repository dictionaries
+        table: Display columns of the repositories
     """
-    # Write table header
-    f.write("| Project | Description | Last Updated | Archived |\n")
-    f.write("|---------|-------------|--------------|----------|\n")
-
-    # Write table rows
-    for repo in repos:
-        name = repo.get("name", "")
-        path = repo.get("path", "")
-        # Clean and truncate description with word-aware truncation
-        raw_desc = repo.get("description", "").replace("|", "\\|").replace("\n", " ")
-        desc = truncate_description(raw_desc, max_length=100)
+    rows = [
+        "| Project | Description | Last Updated | Archived |\n",
+        "|---------|-------------|--------------|----------|\n",
+    ]
 
-        updated = repo.get("updated_at", "")
-        archived = "✓" if repo.get("archived", False) else ""
+    for path, desc, updated, archived in zip(
+        table.paths, table.descs, table.updated_ats, table.archived_flags
+    ):
+        rows.append(f"| {path} | {desc.translate(_MD_ESCAPE)} | {updated} | {archived} |\n")
 
-        f.write(f"| {path} | {desc} | {updated} | {archived} |\n")
+    f.write("".join(rows))
 
 
-def format_json(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -> bool:
+def format_json(
+    data: Dict[str, Dict[str, List[RepoInfo]]], output_file: Path, compact: bool = False
+) -> bool:
     """Format repository data as JSON.
 
+    Uses orjson when it is installed, falling back to the standard library.
+
     Args:
-        data: Repository data grouped by platform and organization
+        data: Repository data grouped by platform and organization, in display order
         output_file: Path to output file
+        compact: Whether to omit indentation and whitespace
 
     Returns:
         True if formatting succeeded, False otherwise
     """
     try:
-        output_data = {"generated_at": datetime.now().isoformat(), "platforms": data}
-
-        with open(output_file, "w") as f:
-            json.dump(output_data, f, indent=2)
+        platforms = {
+            platform: {org: [repo.to_dict() for repo in repos] for org, repos in orgs.items()}
+            for platform, orgs in data.items()
+        }
+        output_data = {"generated_at": datetime.now().isoformat(), "platforms": platforms}
+
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            with open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(output_data, option=option))
+        else:
+            with open(output_file, "w", buffering=WRITE_BUFFER_SIZE) as f:
+                if compact:
+                    json.dump(output_data, f, separators=(",", ":"))
+                else:
+                    json.dump(output_data, f, indent=2)
 
         console.print(f"[green]✓[/green] JSON report saved to {output_file}")
         return True
@@ -178,65 +293,28 @@ def format_json(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -> bo
         return False
 
 
-def format_csv(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -> bool:
+def format_csv(data: Dict[str, Dict[str, List[RepoInfo]]], output_file: Path) -> bool:
     """Format repository data as CSV.
 
     Args:
-        data: Repository data grouped by platform and organization
+        data: Repository data grouped by platform and organization, in display order
         output_file: Path to output file
 
     Returns:
         True if formatting succeeded, False otherwise
     """
     try:
-        with open(output_file, "w", newline="") as f:
-            # Define CSV columns
-            fieldnames = [
-                "platform",
-                "organization",
-                "name",
-                "path",
-                "description",
-                "url",
-                "primary_language",
-                "stars",
-                "forks",
-                "open_issues",
-                "size",
-                "size_bytes",
-                "visibility",
-                "archived",
-                "created_at",
-                "updated_at",
-                "default_branch",
-                "license",
-                "topics",
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
+        with open(output_file, "w", newline="", buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(["platform", "organization", *CSV_FIELDS])
 
             # Write rows for each platform
+            keys = list(CSV_FIELDS.values())
             for platform, orgs in data.items():
                 for org, repos in orgs.items():
                     for repo in repos:
-                        # Get primary language
-                        primary_lang = repo.get("primary_language", "")
-                        if not primary_lang and repo.get("languages"):
-                            languages = repo.get("languages", {})
-                            if languages:
-                                primary_lang = max(
-                                    languages.items(), key=lambda x: x[1]
-                                )[0]
-
-                        row = {
-                            "platform": platform,
-                            "organization": org,
-                            "primary_language": primary_lang,
-                            "topics": ", ".join(repo.get("topics", [])),
-                            **repo,
-                        }
-                        writer.writerow(row)
+                        # Fields the platform does not provide (None) are written empty
+                        writer.writerow([platform, org, *[getattr(repo, key) for key in keys]])
 
         console.print(f"[green]✓[/green] CSV report saved to {output_file}")
         return True
@@ -246,24 +324,51 @@ def format_csv(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -> boo
         return False
 
 
-def format_html(data: Dict[str, Dict[str, List[Dict]]], output_file: Path) -> bool:
+@functools.lru_cache(maxsize=None)
+def get_html_template():
+    """Compile the HTML report template.
+
+    Jinja2 is imported here rather than at module level so that CLI commands
+    which never render HTML do not pay for it. The compiled template is cached
+    for the rest of the process.
+
+    Returns:
+        Compiled Jinja2 template
+    """
+    from jinja2 import Environment, select_autoescape
+
+    env = Environment(
+        autoescape=select_autoescape(["html"], default_for_string=True),
+        auto_reload=False,
+        optimized=True,
+    )
+    return env.from_string(HTML_TEMPLATE)
+
+
+def format_html(
+    data: Dict[str, Dict[str, List[RepoInfo]]],
+    output_file: Path,
+    tables: Optional[Dict[str, Dict[str, NormalizedRepos]]] = None,
+) -> bool:
     """Format repository data as HTML with interactive tables.
 
     Args:
-        data: Repository data grouped by platform and organization
+        data: Repository data grouped by platform and organization, in display order
         output_file: Path to output file
+        tables: Output of ``normalize_for_output(data)``, if already computed
 
     Returns:
         True if formatting succeeded, False otherwise
     """
+    if tables is None:
+        tables = normalize_for_output(data)
+
     try:
-        template = Template(HTML_TEMPLATE)
-        html = template.render(
-            data=data, generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        stream = get_html_template().stream(
+            data=tables, generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         )
-
-        with open(output_file, "w") as f:
-            f.write(html)
+        with open(output_file, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            stream.dump(f)
 
         console.print(f"[green]✓[/green] HTML report saved to {output_file}")
         return True
@@ -310,7 +415,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
         {% if data.gitlab %}
         <h2>GitLab Repositories</h2>
-        {% for group, repos in data.gitlab.items()|sort %}
+        {% for group, table in data.gitlab.items() %}
         <h3>{{ group }}</h3>
         <div class="command">glab repo list --group {{ group }}</div>
         <table>
@@ -322,13 +427,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 </tr>
             </thead>
             <tbody>
-                {% for repo in repos %}
+                {% for path, url, desc, updated_at, archived, private, language, size in table.rows() %}
                 <tr>
-                    <td><a href="{{ repo.url }}" target="_blank">{{ repo.path }}</a>
-                        {% if repo.archived %}<span class="badge badge-archived">Archived</span>{% endif %}
+                    <td><a href="{{ url }}" target="_blank">{{ path }}</a>
+                        {% if archived %}<span class="badge badge-archived">Archived</span>{% endif %}
                     </td>
-                    <td>{{ repo.description|truncate(100, False, '...') }}</td>
-                    <td>{{ repo.updated_at }}</td>
+                    <td>{{ desc }}</td>
+                    <td>{{ updated_at }}</td>
                 </tr>
                 {% endfor %}
             </tbody>
@@ -338,7 +443,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
         {% if data.github %}
         <h2>GitHub Repositories</h2>
-        {% for owner, repos in data.github.items()|sort %}
+        {% for owner, table in data.github.items() %}
         <h3>{{ owner }}</h3>
         <div class="command">gh repo list {{ owner }}</div>
         <table>
@@ -352,20 +457,20 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 </tr>
             </thead>
             <tbody>
-                {% for repo in repos %}
+                {% for path, url, desc, updated_at, archived, private, language, size in table.rows() %}
                 <tr>
-                    <td><a href="{{ repo.url }}" target="_blank">{{ repo.path }}</a>
-                        {% if repo.archived %}<span class="badge badge-archived">Archived</span>{% endif %}
-                        {% if repo.visibility == 'private' %}<span class="badge badge-private">Private</span>{% endif %}
+                    <td><a href="{{ url }}" target="_blank">{{ path }}</a>
+                        {% if archived %}<span class="badge badge-archived">Archived</span>{% endif %}
+                        {% if private %}<span class="badge badge-private">Private</span>{% endif %}
                     </td>
-                    <td>{{ repo.description|truncate(100, False, '...') }}</td>
+                    <td>{{ desc }}</td>
                     <td>
-                        {% if repo.primary_language %}
-                        <span class="badge badge-language">{{ repo.primary_language }}</span>
+                        {% if language %}
+                        <span class="badge badge-language">{{ language }}</span>
                         {% endif %}
                     </td>
-                    <td>{{ repo.size }}</td>
-                    <td>{{ repo.updated_at }}</td>
+                    <td>{{ size }}</td>
+                    <td>{{ updated_at }}</td>
                 </tr>
                 {% endfor %}
             </tbody>
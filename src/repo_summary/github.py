@@ -1,15 +1,115 @@
 """GitHub repository data extraction using gh CLI."""
 
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .utils import console, format_date, format_size, parse_json_output, run_command
+from .utils import (
+    RepoInfo,
+    cache_key,
+    console,
+    format_date,
+    format_size,
+    get_primary_language,
+    language_percentages,
+    parse_json_output,
+    read_cache,
+    run_command_stream,
+    summarize_description,
+    write_cache,
+)
+
+# Fields to fetch from the GitHub API, as named by `gh repo list --json`
+REPO_FIELDS = [
+    "name",
+    "description",
+    "owner",
+    "url",
+    "sshUrl",
+    "createdAt",
+    "updatedAt",
+    "pushedAt",
+    "stargazerCount",
+    "forkCount",
+    "issues",
+    "primaryLanguage",
+    "isPrivate",
+    "isArchived",
+    "isFork",
+    "isTemplate",
+    "visibility",
+    "defaultBranchRef",
+    "diskUsage",
+    "licenseInfo",
+    "repositoryTopics",
+    "hasIssuesEnabled",
+    "hasWikiEnabled",
+]
+
+# Per-language breakdown; an extra connection per repository, so only fetched
+# when asked for
+LANGUAGE_FIELDS = ["languages"]
+
+# GraphQL selection for each of REPO_FIELDS and LANGUAGE_FIELDS
+GRAPHQL_FIELDS = {
+    "name": "name",
+    "description": "description",
+    "owner": "owner { login }",
+    "url": "url",
+    "sshUrl": "sshUrl",
+    "createdAt": "createdAt",
+    "updatedAt": "updatedAt",
+    "pushedAt": "pushedAt",
+    "stargazerCount": "stargazerCount",
+    "forkCount": "forkCount",
+    "issues": "issues(states: OPEN) { totalCount }",
+    "primaryLanguage": "primaryLanguage { name }",
+    "languages": "languages(first: 100) { edges { size node { name } } }",
+    "isPrivate": "isPrivate",
+    "isArchived": "isArchived",
+    "isFork": "isFork",
+    "isTemplate": "isTemplate",
+    "visibility": "visibility",
+    "defaultBranchRef": "defaultBranchRef { name }",
+    "diskUsage": "diskUsage",
+    "licenseInfo": "licenseInfo { name }",
+    "repositoryTopics": "repositoryTopics(first: 100) { nodes { topic { name } } }",
+    "hasIssuesEnabled": "hasIssuesEnabled",
+    "hasWikiEnabled": "hasWikiEnabled",
+}
+
+# GraphQL connections return at most this many nodes per page
+GRAPHQL_PAGE_SIZE = 100
+
+# Owners requested per aliased GraphQL query, to keep each query's cost bounded
+GRAPHQL_OWNER_BATCH_SIZE = 10
+
+# Upper bound on concurrent gh processes, to stay clear of API rate limits
+MAX_CONCURRENT_FETCHES = 10
+
+
+def get_repo_fields(include_languages: bool = False) -> List[str]:
+    """Get the repository fields to request from GitHub.
+
+    Args:
+        include_languages: Whether to include the per-language breakdown
+
+    Returns:
+        List of field names, as used by ``gh repo list --json``
+    """
+    if include_languages:
+        return REPO_FIELDS + LANGUAGE_FIELDS
+    return REPO_FIELDS
 
 
+@functools.lru_cache(maxsize=None)
 def check_github_auth() -> bool:
     """Check if gh is authenticated.
 
+    The result is cached for the rest of the process.
+
     Returns:
         True if authenticated, False otherwise
     """
@@ -18,25 +118,36 @@ def check_github_auth() -> bool:
         result = subprocess.run(
             ["gh", "auth", "status"],
             capture_output=True,
-            text=True,
             check=True
         )
         # gh auth status outputs to stderr, not stdout
-        output = result.stderr + result.stdout
-        return "Logged in" in output
+        return b"Logged in" in result.stderr or b"Logged in" in result.stdout
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
-def get_github_repos(owners: List[str], limit: int = 100) -> Dict[str, List[Dict]]:
+def get_github_repos(
+    owners: List[str],
+    limit: int = 100,
+    cache_ttl: Optional[int] = None,
+    legacy_fetch: bool = False,
+    include_languages: bool = False,
+) -> Dict[str, List[RepoInfo]]:
     """Get repositories for all specified GitHub owners/organizations.
 
+    By default owners are fetched with batched GraphQL queries, up to
+    ``GRAPHQL_OWNER_BATCH_SIZE`` owners per query. With
+    ``legacy_fetch`` each owner is listed with its own ``gh repo list`` call.
+
     Args:
         owners: List of GitHub usernames or organization names
         limit: Maximum number of repos to fetch per owner
+        cache_ttl: Seconds to reuse cached gh responses for (None disables caching)
+        legacy_fetch: Whether to use one ``gh repo list`` call per owner
+        include_languages: Whether to fetch the per-language breakdown
 
     Returns:
-        Dictionary mapping owner names to repository data
+        Dictionary mapping owner names to their RepoInfo records
     """
     if not check_github_auth():
         console.print("[red]GitHub authentication required. Run: gh auth login[/red]")
@@ -49,76 +160,386 @@ def get_github_repos(owners: List[str], limit: int = 100) -> Dict[str, List[Dict
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
+        if legacy_fetch:
+            fetched = fetch_owners_concurrently(
+                owners, limit, cache_ttl, progress, include_languages
+            )
+        else:
+            task = progress.add_task(f"Fetching GitHub repos: {', '.join(owners)}", total=None)
+            fetched = {
+                owner: [extract_repo_info(repo) for repo in repos_data]
+                for owner, repos_data in fetch_owners_graphql(
+                    owners, limit, cache_ttl, include_languages
+                ).items()
+            }
+            progress.remove_task(task)
+
         for owner in owners:
-            task = progress.add_task(f"Fetching GitHub repos: {owner}", total=None)
-            repos = get_owner_repos(owner, limit)
+            repos = fetched.get(owner)
             if repos:
                 all_repos[owner] = repos
                 console.print(f"[green]✓[/green] Found {len(repos)} repos for {owner}")
             else:
                 console.print(f"[yellow]⚠[/yellow] No repos found for {owner}")
+
+    return all_repos
+
+
+def fetch_owners_concurrently(
+    owners: List[str],
+    limit: int,
+    cache_ttl: Optional[int],
+    progress: Progress,
+    include_languages: bool = False,
+) -> Dict[str, List[RepoInfo]]:
+    """Fetch repositories for several owners with concurrent ``gh repo list`` calls.
+
+    Args:
+        owners: List of GitHub usernames or organization names
+        limit: Maximum number of repos to fetch per owner
+        cache_ttl: Seconds to reuse cached gh responses for (None disables caching)
+        progress: Progress display to add a task per owner to
+        include_languages: Whether to fetch the per-language breakdown
+
+    Returns:
+        Dictionary mapping owner names to their RepoInfo records
+    """
+    all_repos = {}
+
+    # Owners are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(owners), MAX_CONCURRENT_FETCHES) or 1) as executor:
+        futures = {}
+        for owner in owners:
+            task = progress.add_task(f"Fetching GitHub repos: {owner}", total=None)
+            futures[executor.submit(
+                get_owner_repos, owner, limit, cache_ttl, include_languages
+            )] = (owner, task)
+
+        for future in as_completed(futures):
+            owner, task = futures[future]
+            try:
+                all_repos[owner] = future.result()
+            except Exception as e:
+                console.print(f"[red]Error fetching repos for {owner}: {e}[/red]")
             progress.remove_task(task)
 
     return all_repos
 
 
-def get_owner_repos(owner: str, limit: int = 100) -> List[Dict]:
+def fetch_owners_graphql(
+    owners: List[str],
+    limit: Optional[int] = 100,
+    cache_ttl: Optional[int] = None,
+    include_languages: bool = False,
+) -> Dict[str, List[Dict]]:
+    """Fetch raw repository data for several owners with batched GraphQL queries.
+
+    The first page of every owner is requested in batched queries, using one
+    aliased ``repositoryOwner`` block per owner (this covers both users and
+    organizations) and at most ``GRAPHQL_OWNER_BATCH_SIZE`` owners per query.
+    Owners with more repositories than fit on one page are then paginated
+    individually.
+
+    Args:
+        owners: List of GitHub usernames or organization names
+        limit: Maximum number of repos to fetch per owner (None for all)
+        cache_ttl: Seconds to reuse cached responses for (None disables caching)
+        include_languages: Whether to fetch the per-language breakdown
+
+    Returns:
+        Dictionary mapping owner names to raw repository nodes, shaped like
+        the output of ``gh repo list --json``
+    """
+    fields = get_repo_fields(include_languages)
+    results = {}
+    to_fetch = []
+    for owner in owners:
+        cached = read_cache(_graphql_cache_key(owner, limit, fields), cache_ttl, fields=fields)
+        if cached is not None:
+            results[owner] = cached
+        else:
+            to_fetch.append(owner)
+
+    if not to_fetch:
+        return results
+
+    per_page = GRAPHQL_PAGE_SIZE if limit is None else min(limit, GRAPHQL_PAGE_SIZE)
+    next_pages = {}
+    complete = set()
+    for start in range(0, len(to_fetch), GRAPHQL_OWNER_BATCH_SIZE):
+        batch = to_fetch[start:start + GRAPHQL_OWNER_BATCH_SIZE]
+        aliases = {f"o{i}": owner for i, owner in enumerate(batch)}
+        query = "query({}) {{ {} }} {}".format(
+            ", ".join(f"${alias}: String!" for alias in aliases),
+            " ".join(
+                f"{alias}: repositoryOwner(login: ${alias}) {{ {_repositories_selection(per_page)} }}"
+                for alias in aliases
+            ),
+            _repo_fragment(fields),
+        )
+
+        pages = _batch_gh_graphql(query, aliases)
+        if not pages:
+            continue
+        data = pages[0]
+
+        for alias, owner in aliases.items():
+            owner_data = data.get(alias)
+            if not owner_data:
+                continue
+            connection = owner_data["repositories"]
+            results[owner] = [_normalize_graphql_repo(node) for node in connection["nodes"]]
+            page_info = connection["pageInfo"]
+            if page_info["hasNextPage"] and (limit is None or len(results[owner]) < limit):
+                next_pages[owner] = page_info["endCursor"]
+            else:
+                complete.add(owner)
+
+    # Page through the remaining repositories of large owners concurrently
+    if next_pages:
+        with ThreadPoolExecutor(max_workers=min(len(next_pages), MAX_CONCURRENT_FETCHES)) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_remaining_pages,
+                    owner,
+                    cursor,
+                    None if limit is None else limit - len(results[owner]),
+                    fields,
+                ): owner
+                for owner, cursor in next_pages.items()
+            }
+            for future in as_completed(futures):
+                owner = futures[future]
+                try:
+                    repos = future.result()
+                except Exception as e:
+                    console.print(f"[red]Error fetching repos for {owner}: {e}[/red]")
+                    continue
+                if repos is not None:
+                    results[owner].extend(repos)
+                    complete.add(owner)
+
+    # Only cache owners whose pages were all fetched successfully
+    if cache_ttl:
+        for owner in complete:
+            write_cache(_graphql_cache_key(owner, limit, fields), results[owner], fields=fields)
+
+    return results
+
+
+def _batch_gh_graphql(
+    query: str, variables: Dict[str, str], paginate: bool = False
+) -> Optional[List[Dict]]:
+    """Run a GraphQL query through a single ``gh api graphql`` process.
+
+    The query is passed on stdin, so its size is not limited by the command
+    line. With ``paginate``, gh follows ``pageInfo.endCursor`` itself and every
+    page is returned from the same process; the query must then declare an
+    ``$endCursor`` variable.
+
+    GraphQL errors (e.g. an unknown owner) are reported, but any partial data
+    returned alongside them is kept.
+
+    Args:
+        query: GraphQL query document
+        variables: String variables for the query
+        paginate: Whether to fetch all pages of the query's connection
+
+    Returns:
+        The ``data`` object of each response page, or None if the request failed
+    """
+    import subprocess
+
+    cmd = ["gh", "api", "graphql", "-F", "query=@-"]
+    for name, value in variables.items():
+        cmd.extend(["-f", f"{name}={value}"])
+    if paginate:
+        cmd.extend(["--paginate", "--slurp"])
+
+    try:
+        result = subprocess.run(cmd, input=query.encode(), capture_output=True)
+    except FileNotFoundError:
+        console.print("[red]Command not found: gh[/red]")
+        console.print("[yellow]Please ensure gh is installed and in your PATH[/yellow]")
+        return None
+
+    response = parse_json_output(result.stdout.strip())
+    pages = [response] if isinstance(response, dict) else response
+    if not isinstance(pages, list):
+        console.print("[red]Error running command: gh api graphql[/red]")
+        console.print(f"[red]{result.stderr.decode(errors='replace')}[/red]")
+        return None
+
+    data = []
+    has_errors = False
+    for page in pages:
+        for error in page.get("errors") or []:
+            console.print(f"[yellow]⚠[/yellow] GitHub API: {error.get('message', error)}")
+            has_errors = True
+        if page.get("data"):
+            data.append(page["data"])
+
+    # A failed request with a plain JSON body (e.g. bad credentials)
+    if result.returncode != 0 and not data and not has_errors:
+        console.print("[red]Error running command: gh api graphql[/red]")
+        console.print(f"[red]{result.stderr.decode(errors='replace')}[/red]")
+        return None
+
+    return data
+
+
+def _fetch_remaining_pages(
+    owner: str, cursor: str, remaining: Optional[int], fields: List[str]
+) -> Optional[List[Dict]]:
+    """Fetch further pages of an owner's repositories, following ``cursor``.
+
+    Each page asks for at most ``remaining`` repositories, so no page beyond
+    the limit is ever requested. Without a limit, all pages come from one
+    paginated gh process.
+
+    Args:
+        owner: GitHub username or organization name
+        cursor: ``endCursor`` of the last page already fetched
+        remaining: Maximum number of additional repos to fetch (None for all)
+        fields: Repository fields to select
+
+    Returns:
+        List of raw repository nodes, or None if any page failed
+    """
+    repos = []
+
+    if remaining is None:
+        pages = _batch_gh_graphql(
+            _owner_page_query(GRAPHQL_PAGE_SIZE, fields),
+            {"owner": owner, "endCursor": cursor},
+            paginate=True,
+        )
+        if not pages:
+            return None
+        for data in pages:
+            if not data.get("repositoryOwner"):
+                return None
+            nodes = data["repositoryOwner"]["repositories"]["nodes"]
+            repos.extend(_normalize_graphql_repo(node) for node in nodes)
+        return repos
+
+    while cursor and remaining > 0:
+        pages = _batch_gh_graphql(
+            _owner_page_query(min(remaining, GRAPHQL_PAGE_SIZE), fields),
+            {"owner": owner, "endCursor": cursor},
+        )
+        if not pages or not pages[0].get("repositoryOwner"):
+            return None
+
+        connection = pages[0]["repositoryOwner"]["repositories"]
+        repos.extend(_normalize_graphql_repo(node) for node in connection["nodes"])
+        remaining -= len(connection["nodes"])
+
+        page_info = connection["pageInfo"]
+        cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+
+    return repos
+
+
+def _owner_page_query(per_page: int, fields: List[str]) -> str:
+    """Build the query for one page of an owner's repositories after ``$endCursor``."""
+    return "query($owner: String!, $endCursor: String) {{ repositoryOwner(login: $owner) {{ {} }} }} {}".format(
+        _repositories_selection(per_page, paginated=True), _repo_fragment(fields)
+    )
+
+
+def _repositories_selection(per_page: int, paginated: bool = False) -> str:
+    """Build the ``repositories`` connection selection for a repository owner."""
+    after = ", after: $endCursor" if paginated else ""
+    return (
+        f"repositories(first: {per_page}{after}, ownerAffiliations: OWNER, "
+        "orderBy: {field: PUSHED_AT, direction: DESC}) "
+        "{ nodes { ...RepoFields } pageInfo { hasNextPage endCursor } }"
+    )
+
+
+def _repo_fragment(fields: List[str]) -> str:
+    """Build the GraphQL fragment selecting ``fields`` on a repository."""
+    return "fragment RepoFields on Repository {{ {} }}".format(
+        " ".join(GRAPHQL_FIELDS[field] for field in fields)
+    )
+
+
+def _graphql_cache_key(owner: str, limit: int, fields: List[str]) -> str:
+    """Build the cache key for an owner's GraphQL repository listing."""
+    return cache_key("graphql", owner, limit, sorted(fields))
+
+
+def _normalize_graphql_repo(node: Dict) -> Dict:
+    """Reshape a GraphQL repository node to match ``gh repo list --json`` output.
+
+    Language sizes live on the connection edges in GraphQL, while
+    ``extract_repo_info`` expects them on the language nodes.
+    """
+    languages = node.get("languages")
+    if languages and "edges" in languages:
+        node["languages"] = {
+            "nodes": [
+                {"name": edge["node"]["name"], "size": edge["size"]}
+                for edge in languages["edges"]
+            ]
+        }
+    return node
+
+
+def get_owner_repos(
+    owner: str,
+    limit: int = 100,
+    cache_ttl: Optional[int] = None,
+    include_languages: bool = False,
+) -> List[RepoInfo]:
     """Get all repositories for a GitHub owner.
 
     Args:
         owner: GitHub username or organization name
         limit: Maximum number of repos to fetch
+        cache_ttl: Seconds to reuse a cached gh response for (None disables caching)
+        include_languages: Whether to fetch the per-language breakdown
 
     Returns:
-        List of repository data dictionaries
+        List of RepoInfo records
     """
-    # Define fields to fetch from GitHub API
-    fields = [
-        "name",
-        "description",
-        "owner",
-        "url",
-        "sshUrl",
-        "createdAt",
-        "updatedAt",
-        "pushedAt",
-        "stargazerCount",
-        "forkCount",
-        "issues",
-        "primaryLanguage",
-        "languages",
-        "isPrivate",
-        "isArchived",
-        "isFork",
-        "isTemplate",
-        "visibility",
-        "defaultBranchRef",
-        "diskUsage",
-        "licenseInfo",
-        "repositoryTopics",
-        "hasIssuesEnabled",
-        "hasWikiEnabled",
-    ]
-
-    # Fetch repos using gh CLI
-    output = run_command([
+    fields = get_repo_fields(include_languages)
+    key = cache_key(owner, limit, sorted(fields))
+    repos_data = read_cache(key, cache_ttl, fields=fields)
+    if repos_data is not None:
+        return [extract_repo_info(repo) for repo in repos_data]
+
+    # With --jq '.[]' gh prints one compact repository per line, so each one
+    # is parsed and extracted as it arrives instead of buffering the listing
+    repos_data = []
+    repos = []
+    with run_command_stream([
         "gh", "repo", "list", owner,
         "--json", ",".join(fields),
-        "--limit", str(limit)
-    ])
-
-    if not output:
+        "--limit", str(limit),
+        "--jq", ".[]",
+    ]) as proc:
+        if proc is None:
+            return []
+        for line in proc.stdout:
+            repo = parse_json_output(line)
+            if repo is None:
+                continue
+            if cache_ttl:
+                repos_data.append(repo)
+            repos.append(extract_repo_info(repo))
+
+    if proc.returncode != 0:
         return []
 
-    repos_data = parse_json_output(output)
-    if not repos_data:
-        return []
+    if cache_ttl:
+        write_cache(key, repos_data, fields=fields)
 
-    # Process each repository
-    return [extract_repo_info(repo) for repo in repos_data]
+    return repos
 
 
-def extract_repo_info(repo: Dict) -> Dict:
+def extract_repo_info(repo: Dict) -> RepoInfo:
     """Extract and normalize repository information.
 
     Args:
@@ -127,20 +548,26 @@ def extract_repo_info(repo: Dict) -> Dict:
     Returns:
         Normalized repository information
     """
+    name = repo.get('name', '')
+    description = repo.get('description', '')
+    url = repo.get('url', '')
+    archived = repo.get('isArchived', False)
+    size_bytes = (repo.get('diskUsage') or 0) * 1024  # diskUsage is in KB
+
     # Extract primary language
     primary_lang = repo.get('primaryLanguage', {})
     primary_language = primary_lang.get('name', '') if primary_lang else ''
 
-    # Extract languages
+    # Extract languages, only present when the breakdown was requested
     languages_data = repo.get('languages', {})
     languages = {}
     if languages_data and 'nodes' in languages_data:
-        total_size = sum(lang.get('size', 0) for lang in languages_data['nodes'])
-        if total_size > 0:
-            languages = {
-                lang['name']: round((lang.get('size', 0) / total_size) * 100, 1)
-                for lang in languages_data['nodes']
-            }
+        sizes = {lang['name']: lang.get('size', 0) for lang in languages_data['nodes']}
+        languages = language_percentages(sizes) or {}
+
+    # Fall back to the largest language when GitHub reports no primary one
+    if not primary_language:
+        primary_language = get_primary_language(languages)
 
     # Extract license
     license_info = repo.get('licenseInfo', {})
@@ -164,46 +591,34 @@ def extract_repo_info(repo: Dict) -> Dict:
     default_branch_ref = repo.get('defaultBranchRef', {})
     default_branch = default_branch_ref.get('name', 'main') if default_branch_ref else 'main'
 
-    return {
-        'name': repo.get('name', ''),
-        'path': f"{owner}/{repo.get('name', '')}",
-        'description': repo.get('description', ''),
-        'url': repo.get('url', ''),
-        'ssh_url': repo.get('sshUrl', ''),
-        'http_url': repo.get('url', '').replace('https://github.com/', 'https://github.com/') + '.git' if repo.get('url') else '',
-        'visibility': 'private' if repo.get('isPrivate', False) else 'public',
-        'archived': repo.get('isArchived', False),
-        'is_fork': repo.get('isFork', False),
-        'is_template': repo.get('isTemplate', False),
-        'stars': repo.get('stargazerCount', 0),
-        'forks': repo.get('forkCount', 0),
-        'open_issues': open_issues,
-        'created_at': format_date(repo.get('createdAt')),
-        'updated_at': format_date(repo.get('updatedAt')),
-        'pushed_at': format_date(repo.get('pushedAt')),
-        'default_branch': default_branch,
-        'primary_language': primary_language,
-        'languages': languages,
-        'size': format_size(repo.get('diskUsage', 0) * 1024) if repo.get('diskUsage') else '0 B',  # diskUsage is in KB
-        'size_bytes': repo.get('diskUsage', 0) * 1024,
-        'license': license_name,
-        'topics': topics,
-        'has_issues': repo.get('hasIssuesEnabled', False),
-        'has_wiki': repo.get('hasWikiEnabled', False),
-        'namespace': owner,
-    }
-
-
-def get_primary_language(languages: Optional[Dict[str, float]]) -> str:
-    """Get the primary language from language breakdown.
-
-    Args:
-        languages: Dictionary of languages and their percentages
-
-    Returns:
-        Name of primary language, or empty string if none
-    """
-    if not languages:
-        return ""
-
-    return max(languages.items(), key=lambda x: x[1])[0]
+    return RepoInfo(
+        name=name,
+        path=f"{owner}/{name}",
+        description=description,
+        desc_short=summarize_description(description),
+        url=url,
+        ssh_url=repo.get('sshUrl', ''),
+        http_url=url + '.git' if url else '',
+        visibility='private' if repo.get('isPrivate', False) else 'public',
+        archived=archived,
+        archived_flag='✓' if archived else '',
+        is_fork=repo.get('isFork', False),
+        is_template=repo.get('isTemplate', False),
+        stars=repo.get('stargazerCount', 0),
+        forks=repo.get('forkCount', 0),
+        open_issues=open_issues,
+        created_at=format_date(repo.get('createdAt')),
+        updated_at=format_date(repo.get('updatedAt')),
+        pushed_at=format_date(repo.get('pushedAt')),
+        default_branch=default_branch,
+        primary_language=primary_language,
+        languages=languages,
+        size=format_size(size_bytes),
+        size_bytes=size_bytes,
+        license=license_name,
+        topics=topics,
+        topics_str=", ".join(topics),
+        has_issues=repo.get('hasIssuesEnabled', False),
+        has_wiki=repo.get('hasWikiEnabled', False),
+        namespace=owner,
+    )
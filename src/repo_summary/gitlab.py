@@ -1,44 +1,86 @@
 """GitLab repository data extraction using glab CLI."""
 
-import urllib.parse
-from typing import Dict, List, Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .utils import console, format_date, format_size, parse_json_output, run_command
-
-
+from .utils import (
+    RepoInfo,
+    cache_key,
+    cached_query,
+    console,
+    format_date,
+    format_size,
+    get_primary_language,
+    iter_json_array,
+    language_percentages,
+    parse_json_output,
+    run_command_stream,
+    summarize_description,
+)
+
+# Upper bound on groups (and personal repos) fetched at the same time
+MAX_CONCURRENT_GROUPS = 8
+
+# Upper bound on concurrent glab calls for per-repo language/statistics lookups
+MAX_CONCURRENT_FETCHES = 16
+
+# Number of projects requested per GraphQL page (GitLab's maximum)
+GRAPHQL_PAGE_SIZE = 100
+
+# Languages and repository size of every project directly in a group
+GROUP_DETAILS_QUERY = (
+    "query($fullPath: ID!, $endCursor: String) { group(fullPath: $fullPath) { "
+    f"projects(first: {GRAPHQL_PAGE_SIZE}, after: $endCursor) {{ "
+    "nodes { fullPath statistics { repositorySize } languages { name share } } "
+    "pageInfo { hasNextPage endCursor } } } }"
+)
+
+# Languages and repository size of a single project
+PROJECT_DETAILS_QUERY = (
+    "query($fullPath: ID!) { project(fullPath: $fullPath) { "
+    "statistics { repositorySize } languages { name share } } }"
+)
+
+
+@functools.lru_cache(maxsize=None)
 def check_gitlab_auth() -> bool:
     """Check if glab is authenticated.
 
+    The result is cached for the rest of the process.
+
     Returns:
         True if authenticated, False otherwise
     """
     import subprocess
 
     try:
-        result = subprocess.run(
-            ["glab", "auth", "status"], capture_output=True, text=True, check=True
-        )
+        result = subprocess.run(["glab", "auth", "status"], capture_output=True, check=True)
         # glab auth status outputs to stderr, not stdout
-        output = result.stderr + result.stdout
-        return "Logged in" in output
+        return b"Logged in" in result.stderr or b"Logged in" in result.stdout
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
 def get_gitlab_groups(
-    groups: List[str], include_languages: bool = False, include_mine: bool = False
-) -> Dict[str, List[Dict]]:
+    groups: List[str],
+    include_languages: bool = False,
+    include_mine: bool = False,
+    cache_ttl: Optional[int] = None,
+) -> Dict[str, List[RepoInfo]]:
     """Get repositories for all specified GitLab groups and optionally personal repos.
 
     Args:
         groups: List of GitLab group names
         include_languages: Whether to fetch language breakdown (slower)
         include_mine: Whether to include personal/user repositories
+        cache_ttl: Seconds to reuse cached language/size lookups for (None disables caching)
 
     Returns:
-        Dictionary mapping group names to repository data
+        Dictionary mapping group names to their RepoInfo records
     """
     if not check_gitlab_auth():
         console.print("[red]GitLab authentication required. Run: glab auth login[/red]")
@@ -51,173 +93,240 @@ def get_gitlab_groups(
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        # Fetch personal repos if requested
+        # Personal repos (keyed by None) and groups are independent, so fetch them concurrently
+        fetched = {}
+        jobs = len(groups) + bool(include_mine)
+        with ThreadPoolExecutor(max_workers=min(jobs, MAX_CONCURRENT_GROUPS) or 1) as executor:
+            futures = {}
+            if include_mine:
+                task = progress.add_task("Fetching personal GitLab repos", total=None)
+                futures[executor.submit(get_user_repos, include_languages, cache_ttl)] = (None, task)
+            for group in groups:
+                task = progress.add_task(f"Fetching GitLab group: {group}", total=None)
+                futures[executor.submit(
+                    get_group_repos, group, include_languages, cache_ttl
+                )] = (group, task)
+
+            for future in as_completed(futures):
+                group, task = futures[future]
+                try:
+                    fetched[group] = future.result()
+                except Exception as e:
+                    console.print(f"[red]Error fetching repos for {group or 'personal'}: {e}[/red]")
+                progress.remove_task(task)
+
+        # Report in the order requested
         if include_mine:
-            task = progress.add_task("Fetching personal GitLab repos", total=None)
-            repos = get_user_repos(include_languages)
+            repos = fetched.get(None)
             if repos:
                 all_repos["personal"] = repos
                 console.print(f"[green]✓[/green] Found {len(repos)} personal repos")
             else:
                 console.print(f"[yellow]⚠[/yellow] No personal repos found")
-            progress.remove_task(task)
 
-        # Fetch group repos
         for group in groups:
-            task = progress.add_task(f"Fetching GitLab group: {group}", total=None)
-            repos = get_group_repos(group, include_languages)
+            repos = fetched.get(group)
             if repos:
                 all_repos[group] = repos
                 console.print(f"[green]✓[/green] Found {len(repos)} repos in {group}")
             else:
                 console.print(f"[yellow]⚠[/yellow] No repos found in {group}")
-            progress.remove_task(task)
 
     return all_repos
 
 
-def get_user_repos(include_languages: bool = False) -> List[Dict]:
+def get_user_repos(
+    include_languages: bool = False, cache_ttl: Optional[int] = None
+) -> List[RepoInfo]:
     """Get personal repositories for the authenticated user (under their username).
 
     Args:
         include_languages: Whether to fetch language breakdown
+        cache_ttl: Seconds to reuse cached language/size lookups for (None disables caching)
 
     Returns:
-        List of repository data dictionaries
+        List of RepoInfo records
     """
-    # First get the authenticated username
-    username = get_authenticated_username()
-    if not username:
-        return []
+    # Fetch all owned repos, every page from a single glab process. Keyset
+    # pagination keeps each page equally cheap and is not capped at 10,000 projects.
+    owned = []
+    repos = []
+    for repo in glab_paginate(
+        "projects?owned=true&per_page=100&pagination=keyset&order_by=id&sort=asc"
+    ):
+        # Projects in groups the user owns are listed too; keep the personal ones
+        if (repo.get("namespace") or {}).get("kind", "") == "user":
+            owned.append(repo)
+            repos.append(extract_repo_info(repo))
+
+    # Optionally fetch language data and statistics
+    if include_languages:
+        add_languages_and_statistics(owned, repos, cache_ttl)
 
-    # Fetch all repos with pagination
-    all_repos_data = []
-    page = 1
-    while True:
-        output = run_command(
-            [
-                "glab",
-                "repo",
-                "list",
-                "--mine",
-                "--per-page",
-                "100",
-                "--page",
-                str(page),
-                "--output",
-                "json",
-            ]
-        )
-
-        if not output:
-            break
+    return repos
 
-        repos_data = parse_json_output(output)
-        if not repos_data:
-            break
 
-        all_repos_data.extend(repos_data)
+def glab_paginate(endpoint: str) -> Iterator[Dict]:
+    """Iterate over every item of a GitLab REST list endpoint.
 
-        # If we got fewer than per-page items, we've reached the end
-        if len(repos_data) < 100:
-            break
+    ``glab api --paginate`` follows the ``Link: rel="next"`` headers itself
+    (for both offset and keyset pagination), so all pages come from one
+    process instead of one ``glab`` call per page. Items are yielded while
+    glab is still fetching later pages, so callers process one page while
+    the next is on its way (when ijson is installed).
 
-        page += 1
+    Args:
+        endpoint: API endpoint including query parameters (e.g., 'projects?owned=true')
 
-    # Filter to only repos owned by the user (personal repos)
-    repos = []
-    for repo in all_repos_data:
-        repo_namespace = repo.get("namespace", {}).get("path", "")
-        repo_kind = repo.get("namespace", {}).get("kind", "")
-
-        # Only include repos where namespace matches username (personal repos)
-        if repo_namespace == username and repo_kind == "user":
-            repo_info = extract_repo_info(repo)
-
-            # Optionally fetch language data and statistics
-            if include_languages:
-                languages = get_repo_languages(repo.get("path_with_namespace", ""))
-                if languages:
-                    repo_info["languages"] = languages
-                    repo_info["primary_language"] = get_primary_language(languages)
-
-                # Also fetch statistics when getting languages (both are expensive)
-                project_id = repo.get("id")
-                if project_id:
-                    stats = get_project_statistics(project_id)
-                    if stats:
-                        repo_info["size"] = format_size(stats.get("repository_size", 0))
-                        repo_info["size_bytes"] = stats.get("repository_size", 0)
-
-            repos.append(repo_info)
+    Yields:
+        Items of all pages in order; failures are reported and end the iteration
+    """
+    with run_command_stream(["glab", "api", "--paginate", endpoint]) as proc:
+        if proc is None:
+            return
+        yield from iter_json_array(proc.stdout, pages=True)
 
-    return repos
 
+def get_group_repos(
+    group: str, include_languages: bool = False, cache_ttl: Optional[int] = None
+) -> List[RepoInfo]:
+    """Get all repositories for a GitLab group.
 
-def get_authenticated_username() -> Optional[str]:
-    """Get the authenticated username from GitLab.
+    Args:
+        group: GitLab group name
+        include_languages: Whether to fetch language breakdown
+        cache_ttl: Seconds to reuse cached language/size lookups for (None disables caching)
 
     Returns:
-        Username string or None if fetch failed
+        List of RepoInfo records
     """
-    output = run_command(["glab", "api", "user"])
+    # Fetch repos using glab CLI, processing each repository as it is parsed
+    repos = []
+    activity = []
+    with run_command_stream(["glab", "repo", "list", "--group", group, "--output", "json"]) as proc:
+        if proc is None:
+            return []
+        for repo in iter_json_array(proc.stdout):
+            repos.append(extract_repo_info(repo))
+            activity.append((repo.get("path_with_namespace"), repo.get("last_activity_at")))
+
+    if proc.returncode != 0:
+        return []
 
-    if not output:
-        return None
+    # Optionally fetch language data and statistics for the whole group at once.
+    # The cached result stays valid until any project in the group sees activity.
+    if include_languages and repos:
+        details = cached_query(
+            cache_key("gitlab", "group-details", group, activity),
+            cache_ttl,
+            lambda: fetch_group_via_graphql(group),
+        ) or {}
+        repos = [
+            with_languages_and_size(repo_info, *details.get(repo_info.path, (None, None)))
+            for repo_info in repos
+        ]
 
-    user_data = parse_json_output(output)
-    if not user_data:
-        return None
+    return repos
 
-    return user_data.get("username")
 
+def fetch_group_via_graphql(
+    group: str,
+) -> Optional[Dict[str, Tuple[Optional[Dict[str, float]], Optional[int]]]]:
+    """Get language breakdowns and repository sizes for a group's projects.
 
-def get_group_repos(group: str, include_languages: bool = False) -> List[Dict]:
-    """Get all repositories for a GitLab group.
+    One GraphQL query returns both for a whole page of projects.
 
     Args:
         group: GitLab group name
-        include_languages: Whether to fetch language breakdown
 
     Returns:
-        List of repository data dictionaries
+        Dictionary mapping project paths to (language percentages, repository
+        size in bytes); either is None if GitLab did not return it. None if
+        any page could not be fetched, so that partial results are not cached
     """
-    # Fetch repos using glab CLI
-    output = run_command(["glab", "repo", "list", "--group", group, "--output", "json"])
+    details = {}
+    cursor = None
+    while True:
+        variables = {"fullPath": group}
+        if cursor:
+            variables["endCursor"] = cursor
 
-    if not output:
-        return []
+        data = glab_graphql(GROUP_DETAILS_QUERY, variables)
+        group_data = (data or {}).get("group")
+        if not group_data or not group_data.get("projects"):
+            return None
+        projects = group_data["projects"]
 
-    repos_data = parse_json_output(output)
-    if not repos_data:
-        return []
+        for node in projects.get("nodes") or []:
+            details[node.get("fullPath", "")] = _project_details(node)
 
-    # Process each repository
-    repos = []
-    for repo in repos_data:
-        repo_info = extract_repo_info(repo)
-
-        # Optionally fetch language data and statistics
-        if include_languages:
-            languages = get_repo_languages(repo.get("path_with_namespace", ""))
-            if languages:
-                repo_info["languages"] = languages
-                repo_info["primary_language"] = get_primary_language(languages)
-
-            # Also fetch statistics when getting languages (both are expensive)
-            project_id = repo.get("id")
-            if project_id:
-                stats = get_project_statistics(project_id)
-                if stats:
-                    repo_info["size"] = format_size(stats.get("repository_size", 0))
-                    repo_info["size_bytes"] = stats.get("repository_size", 0)
-
-        repos.append(repo_info)
+        page_info = projects.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
 
-    return repos
+    return details
+
+
+def add_languages_and_statistics(
+    repos_data: List[Dict], repos: List[RepoInfo], cache_ttl: Optional[int] = None
+) -> None:
+    """Fetch language breakdowns and statistics and merge them into repository info.
 
+    Each project needs its own ``glab api graphql`` call, which mostly waits
+    on the network, so they are run concurrently.
 
-def extract_repo_info(repo: Dict) -> Dict:
+    Args:
+        repos_data: Raw repository data from glab
+        repos: Normalized repository information, in the same order as repos_data;
+            updated in place
+        cache_ttl: Seconds to reuse cached lookups for (None disables caching)
+    """
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        pending = [
+            executor.submit(
+                get_project_details,
+                repo.get("path_with_namespace", ""),
+                repo.get("last_activity_at"),
+                cache_ttl,
+            )
+            for repo in repos_data
+        ]
+
+        # Merge in repository order so the output does not depend on timing
+        for index, future in enumerate(pending):
+            details = future.result()
+            if details:
+                repos[index] = with_languages_and_size(repos[index], *details)
+
+
+def with_languages_and_size(
+    repo_info: RepoInfo,
+    languages: Optional[Dict[str, float]],
+    size_bytes: Optional[int],
+) -> RepoInfo:
+    """Return repository information updated with its language breakdown and size.
+
+    Args:
+        repo_info: Normalized repository information
+        languages: Language percentages, or None if not available
+        size_bytes: Repository size in bytes, or None if not available
+
+    Returns:
+        Updated repository information (repo_info itself if nothing changed)
+    """
+    changes = {}
+    if languages:
+        changes["languages"] = languages
+        changes["primary_language"] = get_primary_language(languages)
+    if size_bytes is not None:
+        changes["size"] = format_size(size_bytes)
+        changes["size_bytes"] = size_bytes
+
+    return replace(repo_info, **changes) if changes else repo_info
+
+
+def extract_repo_info(repo: Dict) -> RepoInfo:
     """Extract and normalize repository information.
 
     Args:
@@ -226,95 +335,130 @@ def extract_repo_info(repo: Dict) -> Dict:
     Returns:
         Normalized repository information
     """
-    size_bytes = 0
-    if repo.get("statistics"):
-        size_bytes = repo.get("statistics", {}).get("repository_size", 0)
-
-    return {
-        "name": repo.get("name", ""),
-        "path": repo.get("path_with_namespace", ""),
-        "description": repo.get("description", ""),
-        "url": repo.get("web_url", ""),
-        "ssh_url": repo.get("ssh_url_to_repo", ""),
-        "http_url": repo.get("http_url_to_repo", ""),
-        "visibility": repo.get("visibility", "unknown"),
-        "archived": repo.get("archived", False),
-        "stars": repo.get("star_count", 0),
-        "forks": repo.get("forks_count", 0),
-        "created_at": format_date(repo.get("created_at")),
-        "updated_at": format_date(repo.get("last_activity_at")),
-        "default_branch": repo.get("default_branch", "main"),
-        "topics": repo.get("topics", []),
-        "namespace": repo.get("namespace", {}).get("name", ""),
-        "size": format_size(size_bytes),
-        "size_bytes": size_bytes,
-    }
-
-
-def get_repo_languages(repo_path: str) -> Optional[Dict[str, float]]:
-    """Get language breakdown for a repository.
+    statistics = repo.get("statistics") or {}
+    namespace = repo.get("namespace") or {}
+    size_bytes = statistics.get("repository_size", 0)
+
+    description = repo.get("description", "")
+    archived = repo.get("archived", False)
+    topics = repo.get("topics") or []
+
+    return RepoInfo(
+        name=repo.get("name", ""),
+        path=repo.get("path_with_namespace", ""),
+        description=description,
+        desc_short=summarize_description(description),
+        url=repo.get("web_url", ""),
+        ssh_url=repo.get("ssh_url_to_repo", ""),
+        http_url=repo.get("http_url_to_repo", ""),
+        visibility=repo.get("visibility", "unknown"),
+        archived=archived,
+        archived_flag="✓" if archived else "",
+        stars=repo.get("star_count", 0),
+        forks=repo.get("forks_count", 0),
+        created_at=format_date(repo.get("created_at")),
+        updated_at=format_date(repo.get("last_activity_at")),
+        default_branch=repo.get("default_branch", "main"),
+        topics=topics,
+        topics_str=", ".join(topics),
+        namespace=namespace.get("name", ""),
+        size=format_size(size_bytes),
+        size_bytes=size_bytes,
+    )
+
+
+def get_project_details(
+    repo_path: str,
+    last_activity_at: Optional[str] = None,
+    cache_ttl: Optional[int] = None,
+) -> Optional[Tuple[Optional[Dict[str, float]], Optional[int]]]:
+    """Get the language breakdown and repository size of a single project.
+
+    Results are cached per repository and last activity, so an unchanged
+    repository is not queried again. Without ``last_activity_at`` the cache
+    is bypassed.
 
     Args:
         repo_path: Repository path (e.g., 'group/project')
+        last_activity_at: The project's ``last_activity_at`` timestamp
+        cache_ttl: Seconds to reuse a cached result for (None disables caching)
 
     Returns:
-        Dictionary mapping language names to percentages, or None if fetch failed
+        Tuple of (language percentages, repository size in bytes), either of
+        which is None if GitLab did not return it, or None if the fetch failed
     """
-    # URL-encode the project path
-    encoded_path = urllib.parse.quote(repo_path, safe="")
+    return cached_query(
+        cache_key("gitlab", "details", repo_path, last_activity_at),
+        cache_ttl if last_activity_at else None,
+        lambda: fetch_repo_lang_and_stats(repo_path),
+    )
 
-    # Use glab API to fetch languages
-    output = run_command(["glab", "api", f"projects/{encoded_path}/languages"])
 
-    if not output:
-        return None
+def fetch_repo_lang_and_stats(
+    repo_path: str,
+) -> Optional[Tuple[Optional[Dict[str, float]], Optional[int]]]:
+    """Fetch a project's language breakdown and repository size in one GraphQL call.
 
-    languages_data = parse_json_output(output)
-    if not languages_data:
-        return None
+    Args:
+        repo_path: Repository path (e.g., 'group/project')
 
-    # Convert byte counts to percentages
-    total_bytes = sum(languages_data.values())
-    if total_bytes == 0:
+    Returns:
+        Tuple of (language percentages, repository size in bytes), or None if
+        the fetch failed
+    """
+    data = glab_graphql(PROJECT_DETAILS_QUERY, {"fullPath": repo_path})
+    if not data or not data.get("project"):
         return None
 
-    return {
-        lang: round((bytes_count / total_bytes) * 100, 1)
-        for lang, bytes_count in languages_data.items()
-    }
+    return _project_details(data["project"])
+
 
+def glab_graphql(query: str, variables: Dict[str, str]) -> Optional[Dict]:
+    """Run a GraphQL query through ``glab api graphql``.
 
-def get_project_statistics(project_id: int) -> Optional[Dict]:
-    """Get repository statistics for a project.
+    GraphQL errors are reported, but any partial data returned alongside
+    them is kept. glab exits non-zero whenever the response has errors, so
+    the output is parsed regardless of the exit status.
 
     Args:
-        project_id: GitLab project ID
+        query: GraphQL query document
+        variables: String variables for the query
 
     Returns:
-        Dictionary containing repository statistics, or None if fetch failed
+        The response's ``data`` object, or None if the request failed
     """
-    output = run_command(["glab", "api", f"projects/{project_id}?statistics=true"])
+    import subprocess
 
-    if not output:
-        return None
+    cmd = ["glab", "api", "graphql", "-f", f"query={query}"]
+    for name, value in variables.items():
+        cmd.extend(["-f", f"{name}={value}"])
 
-    data = parse_json_output(output)
-    if not data:
+    try:
+        result = subprocess.run(cmd, capture_output=True)
+    except FileNotFoundError:
+        console.print("[red]Command not found: glab[/red]")
+        console.print("[yellow]Please ensure glab is installed and in your PATH[/yellow]")
         return None
 
-    return data.get("statistics")
+    response = parse_json_output(result.stdout.strip())
+    if not isinstance(response, dict) or (
+        result.returncode != 0 and not response.get("data") and not response.get("errors")
+    ):
+        console.print("[red]Error running command: glab api graphql[/red]")
+        console.print(f"[red]{result.stderr.decode(errors='replace')}[/red]")
+        return None
 
+    for error in response.get("errors") or []:
+        console.print(f"[yellow]⚠[/yellow] GitLab API: {error.get('message', error)}")
 
-def get_primary_language(languages: Optional[Dict[str, float]]) -> str:
-    """Get the primary language from language breakdown.
+    return response.get("data")
 
-    Args:
-        languages: Dictionary of languages and their percentages
-
-    Returns:
-        Name of primary language, or empty string if none
-    """
-    if not languages:
-        return ""
 
-    return max(languages.items(), key=lambda x: x[1])[0]
+def _project_details(node: Dict) -> Tuple[Optional[Dict[str, float]], Optional[int]]:
+    """Extract (language percentages, repository size) from a GraphQL project node."""
+    shares = {lang["name"]: lang["share"] for lang in node.get("languages") or []}
+    statistics = node.get("statistics")
+    return (
+        language_percentages(shares),
+        int(statistics["repositorySize"]) if statistics else None,
+    )
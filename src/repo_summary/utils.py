@@ -1,38 +1,141 @@
 """Common utilities for repository summary generation."""
 
+import functools
+import hashlib
 import json
+import os
+import shutil
 import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Union
 
 import yaml
 from rich.console import Console
 
+# Optional accelerators from the "fast" extra. They are resolved once here
+# because a failed import is retried on every call, and some of these run
+# per repo.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 console = Console()
 
+# Line breaks flattened out of descriptions shown in report tables
+_DESC_FLATTEN = str.maketrans({"\n": " ", "\r": " "})
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
-def run_command(cmd: List[str], capture_output: bool = True) -> Optional[str]:
+# Location and default lifetime (in seconds) of cached API responses
+CACHE_DIR = Path.home() / ".cache" / "repo_summary"
+DEFAULT_CACHE_TTL = 3600
+
+
+@dataclass(frozen=True, slots=True)
+class RepoInfo:
+    """Normalized information about a single repository.
+
+    Fields a platform does not provide default to None and are left out of
+    ``to_dict``. The display strings at the end are derived from the other
+    fields when the repository is extracted, for use by the report tables.
+    """
+
+    name: str
+    path: str
+    description: Optional[str]
+    url: str
+    ssh_url: str
+    http_url: str
+    visibility: str
+    archived: bool
+    stars: int
+    forks: int
+    created_at: str
+    updated_at: str
+    default_branch: str
+    topics: List[str]
+    namespace: str
+    size: str
+    size_bytes: int
+    primary_language: Optional[str] = None
+    languages: Optional[Dict[str, float]] = None
+    # GitHub only
+    is_fork: Optional[bool] = None
+    is_template: Optional[bool] = None
+    open_issues: Optional[int] = None
+    pushed_at: Optional[str] = None
+    license: Optional[str] = None
+    has_issues: Optional[bool] = None
+    has_wiki: Optional[bool] = None
+    # Display strings
+    desc_short: str = ""
+    archived_flag: str = ""
+    topics_str: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for serialization.
+
+        Returns:
+            Dictionary of the repository's fields, without the display strings
+        """
+        data = {}
+        for name in _REPO_INFO_FIELDS:
+            value = getattr(self, name)
+            if value is not None or name not in _REPO_INFO_OPTIONAL:
+                data[name] = value
+        return data
+
+
+_REPO_INFO_FIELDS = tuple(
+    f.name for f in fields(RepoInfo) if f.name not in ("desc_short", "archived_flag", "topics_str")
+)
+_REPO_INFO_OPTIONAL = frozenset(f.name for f in fields(RepoInfo) if f.default is None)
+
+
+def run_command(
+    cmd: List[str], capture_output: bool = True, text: bool = True
+) -> Optional[Union[str, bytes]]:
     """Run a shell command and return its output.
 
     Args:
         cmd: Command as a list of strings
         capture_output: Whether to capture and return output
+        text: Whether to decode the output; pass False for output that goes
+            straight to ``parse_json_output``
 
     Returns:
-        Command output as string, or None if command failed
+        Command output as string (bytes if not text), or None if command failed
     """
     try:
         result = subprocess.run(
             cmd,
             capture_output=capture_output,
-            text=True,
+            text=text,
             check=True
         )
         return result.stdout.strip() if capture_output else None
     except subprocess.CalledProcessError as e:
+        stderr = e.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode(errors="replace")
         console.print(f"[red]Error running command: {' '.join(cmd)}[/red]")
-        console.print(f"[red]{e.stderr}[/red]")
+        console.print(f"[red]{stderr}[/red]")
         return None
     except FileNotFoundError:
         console.print(f"[red]Command not found: {cmd[0]}[/red]")
@@ -40,11 +143,51 @@ def run_command(cmd: List[str], capture_output: bool = True) -> Optional[str]:
         return None
 
 
-def parse_json_output(output: Optional[str]) -> Optional[Any]:
+@contextmanager
+def run_command_stream(cmd: List[str]) -> Iterator[Optional[subprocess.Popen]]:
+    """Run a shell command whose output is consumed while it is produced.
+
+    Yields the running process, whose ``stdout`` is a binary pipe. Once the
+    block exits the process has finished, its ``returncode`` is set, and a
+    failure has been reported the same way as in ``run_command``.
+
+    Args:
+        cmd: Command as a list of strings
+
+    Yields:
+        The running process, or None if the command could not be started
+    """
+    # stderr goes to a temporary file so a chatty command cannot fill its
+    # pipe and stall while stdout is being read
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        except FileNotFoundError:
+            console.print(f"[red]Command not found: {cmd[0]}[/red]")
+            console.print(f"[yellow]Please ensure {cmd[0]} is installed and in your PATH[/yellow]")
+            yield None
+            return
+
+        with proc:
+            try:
+                yield proc
+            except BaseException:
+                proc.kill()
+                raise
+
+        if proc.returncode != 0:
+            stderr.seek(0)
+            console.print(f"[red]Error running command: {' '.join(cmd)}[/red]")
+            console.print(f"[red]{stderr.read().decode(errors='replace')}[/red]")
+
+
+def parse_json_output(output: Optional[Union[str, bytes]]) -> Optional[Any]:
     """Parse JSON output from a command.
 
+    Uses orjson when it is installed, falling back to the standard library.
+
     Args:
-        output: JSON string from command
+        output: JSON text or bytes from command
 
     Returns:
         Parsed JSON data, or None if parsing failed
@@ -53,12 +196,178 @@ def parse_json_output(output: Optional[str]) -> Optional[Any]:
         return None
 
     try:
-        return json.loads(output)
+        return _json_loads(output)
     except json.JSONDecodeError as e:
         console.print(f"[red]Error parsing JSON: {e}[/red]")
         return None
 
 
+def iter_json_array(stream: BinaryIO, pages: bool = False) -> Iterator[Any]:
+    """Iterate over the items of a JSON array read from a binary stream.
+
+    With ijson installed each item is parsed as it arrives, so the whole
+    array is never held in memory at once. Otherwise the stream is read
+    and parsed in one go.
+
+    Args:
+        stream: Binary stream containing a JSON array, e.g. a process's stdout
+        pages: Whether the stream holds several arrays back to back, as
+            written by ``glab api --paginate``
+
+    Yields:
+        Items of the array(s); nothing if the stream is empty or malformed
+    """
+    if ijson is None:
+        if pages:
+            yield from parse_json_pages(stream.read().decode()) or []
+        else:
+            yield from parse_json_output(stream.read()) or []
+        return
+
+    # A failed command writes nothing, which is not worth a parse error
+    if not stream.peek(1):
+        return
+
+    try:
+        yield from ijson.items(stream, "item", use_float=True, multiple_values=pages)
+    except ijson.JSONError as e:
+        console.print(f"[red]Error parsing JSON: {e}[/red]")
+
+
+def parse_json_pages(output: Optional[str]) -> Optional[List[Any]]:
+    """Parse paginated JSON output made of one JSON array per page.
+
+    ``glab api --paginate`` writes the pages back to back (``[...][...]``)
+    rather than as a single document.
+
+    Args:
+        output: JSON text from command
+
+    Returns:
+        Items of all pages in order, or None if parsing failed
+    """
+    if output is None:
+        return None
+
+    decoder = json.JSONDecoder()
+    items = []
+    pos = 0
+    end = len(output)
+    try:
+        while True:
+            # Skip whitespace between pages
+            while pos < end and output[pos].isspace():
+                pos += 1
+            if pos == end:
+                return items
+            page, pos = decoder.raw_decode(output, pos)
+            if isinstance(page, list):
+                items.extend(page)
+            else:
+                items.append(page)
+    except json.JSONDecodeError as e:
+        console.print(f"[red]Error parsing JSON: {e}[/red]")
+        return None
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values identifying the cached query
+
+    Returns:
+        Hex digest suitable for use as a cache file name
+    """
+    serialized = json.dumps(parts, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.md5(serialized.encode()).digest().hex()
+
+
+def read_cache(key: str, ttl: Optional[int], **metadata: Any) -> Optional[Any]:
+    """Read JSON data from the on-disk cache.
+
+    Args:
+        key: Cache key, see ``cache_key``
+        ttl: Maximum age of the entry in seconds; None or 0 disables the cache
+        **metadata: Values the entry must have been stored with
+
+    Returns:
+        Cached data, or None if there is no fresh matching entry
+    """
+    if not ttl:
+        return None
+
+    cache_file = CACHE_DIR / f"{key}.json"
+
+    try:
+        if time.time() - cache_file.stat().st_mtime >= ttl:
+            return None
+        with open(cache_file, "r") as f:
+            entry = json.load(f)
+        if all(entry.get(name) == value for name, value in metadata.items()):
+            return entry["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    return None
+
+
+def write_cache(key: str, data: Any, **metadata: Any) -> None:
+    """Write JSON data to the on-disk cache.
+
+    Entries are stored as ``{"fetched_at": ..., **metadata, "data": ...}`` and
+    replaced atomically. Cache I/O errors are ignored.
+
+    Args:
+        key: Cache key, see ``cache_key``
+        data: JSON-serializable data to store
+        **metadata: Extra values stored with the entry and checked on read
+    """
+    entry = {"fetched_at": datetime.now().isoformat(), **metadata, "data": data}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, CACHE_DIR / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def cached_query(
+    key: str,
+    ttl: Optional[int],
+    fetch: Callable[[], Optional[Any]],
+    **metadata: Any,
+) -> Optional[Any]:
+    """Return JSON data from the on-disk cache, or fetch and cache it.
+
+    Failed fetches (``None``) are never cached.
+
+    Args:
+        key: Cache key, see ``cache_key``
+        ttl: Maximum age of a cached entry in seconds; None or 0 disables the cache
+        fetch: Callable producing fresh JSON-serializable data
+        **metadata: Extra values stored with the entry and checked on reuse
+
+    Returns:
+        Cached or freshly fetched data, or None if the fetch failed
+    """
+    data = read_cache(key, ttl, **metadata)
+    if data is not None:
+        return data
+
+    data = fetch()
+    if data is not None and ttl:
+        write_cache(key, data, **metadata)
+
+    return data
+
+
 def load_config(config_path: Path) -> Optional[Dict]:
     """Load configuration from YAML file.
 
@@ -80,9 +389,12 @@ def load_config(config_path: Path) -> Optional[Dict]:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date(date_str: Optional[str], format: str = "%Y-%m-%d") -> str:
     """Format an ISO date string to a more readable format.
 
+    Timestamps are parsed with ciso8601 when it is installed.
+
     Args:
         date_str: ISO format date string
         format: Output date format
@@ -96,7 +408,11 @@ def format_date(date_str: Optional[str], format: str = "%Y-%m-%d") -> str:
     try:
         # Try parsing ISO format with timezone
         if 'T' in date_str:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            if _parse_iso_datetime is not None:
+                dt = _parse_iso_datetime(date_str)
+            else:
+                iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
+                dt = datetime.fromisoformat(iso_str)
         else:
             dt = datetime.strptime(date_str, "%Y-%m-%d")
         return dt.strftime(format)
@@ -105,6 +421,7 @@ def format_date(date_str: Optional[str], format: str = "%Y-%m-%d") -> str:
         return date_str
 
 
+@functools.lru_cache(maxsize=4096)
 def format_size(size_bytes: Optional[int]) -> str:
     """Format size in bytes to human-readable format.
 
@@ -117,19 +434,97 @@ def format_size(size_bytes: Optional[int]) -> str:
     if size_bytes is None or size_bytes == 0:
         return "0 B"
 
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    size = float(size_bytes)
-    unit_index = 0
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    size = size_bytes / (1 << (unit_index * 10))
+
+    return f"{size:.1f} {_SIZE_UNITS[unit_index]}"
+
 
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+def language_percentages(languages_data: Dict[str, float]) -> Optional[Dict[str, float]]:
+    """Scale a language breakdown so that it adds up to 100%.
 
-    return f"{size:.1f} {units[unit_index]}"
+    Args:
+        languages_data: Dictionary mapping language names to their share
 
+    Returns:
+        Dictionary mapping language names to percentages, or None if empty
+    """
+    # Convert byte counts to percentages, scaling by one precomputed factor
+    total_bytes = sum(languages_data.values())
+    if total_bytes == 0:
+        return None
 
+    scale = 100.0 / total_bytes
+    return {lang: round(bytes_count * scale, 1) for lang, bytes_count in languages_data.items()}
+
+
+def get_primary_language(languages: Optional[Dict[str, float]]) -> str:
+    """Get the primary language from language breakdown.
+
+    Args:
+        languages: Dictionary of languages and their percentages
+
+    Returns:
+        Name of primary language, or empty string if none
+    """
+    if not languages:
+        return ""
+    if len(languages) == 1:
+        return next(iter(languages))
+
+    return max(languages, key=languages.__getitem__)
+
+
+def truncate_description(text: str, max_length: int = 100, suffix: str = "...") -> str:
+    """Truncate text at word boundary with ellipsis.
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum length before truncation (default: 100)
+        suffix: Suffix to add when truncating (default: "...")
+
+    Returns:
+        Truncated text with suffix, or original text if within limit
+    """
+    if len(text) <= max_length:
+        return text
+
+    # Truncate to max_length
+    truncated = text[:max_length]
+
+    # Find the last space before the truncation point
+    last_space = truncated.rfind(" ")
+
+    # Only use word boundary if it's reasonably close (at least 70% of max_length)
+    if last_space > max_length * 0.7:
+        return truncated[:last_space] + suffix
+    else:
+        # No good word boundary found, just truncate and add suffix
+        return truncated + suffix
+
+
+def summarize_description(description: Optional[str], max_length: int = 100) -> str:
+    """Flatten a description onto one line and truncate it for display.
+
+    Args:
+        description: Repository description, possibly None
+        max_length: Maximum length before truncation (default: 100)
+
+    Returns:
+        Single-line description, truncated at a word boundary if too long
+    """
+    if not description:
+        return ""
+
+    return truncate_description(description.translate(_DESC_FLATTEN), max_length=max_length)
+
+
+@functools.lru_cache(maxsize=None)
 def check_cli_available(cli_name: str) -> bool:
-    """Check if a CLI tool is available.
+    """Check if a CLI tool is available on PATH.
+
+    The result is cached for the rest of the process.
 
     Args:
         cli_name: Name of the CLI tool to check
@@ -137,15 +532,7 @@ def check_cli_available(cli_name: str) -> bool:
     Returns:
         True if CLI is available, False otherwise
     """
-    try:
-        subprocess.run(
-            [cli_name, "--version"],
-            capture_output=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which(cli_name) is not None
 
 
 def ensure_output_directory(output_dir: Path) -> bool: